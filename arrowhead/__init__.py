@@ -6,10 +6,24 @@ This package provides both a Python SDK for developing Arrowhead-compatible appl
 and a Python CLI tool for managing Arrowhead systems.
 """
 
+from typing import TYPE_CHECKING, Any
+
 # High-level decorator API
 from .decorators import ArrowheadProvider, service, system
-from .framework import Framework
 from .service import Params, Service
 
+if TYPE_CHECKING:
+    from .framework import Framework
+
 __version__ = "0.1.0"
 __all__ = ["Framework", "Service", "Params", "system", "service", "ArrowheadProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    # Framework is imported on first access (PEP 562), so that importing the
+    # package or a submodule such as the CLI does not load FastAPI and uvicorn.
+    if name == "Framework":
+        from .framework import Framework
+
+        return Framework
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
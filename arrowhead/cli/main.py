@@ -15,6 +15,7 @@ from rich.table import Table
 from ..core.models import SystemRegistration
 from ..rpc.client import ArrowheadClient
 from ..rpc.config import Config, HTTPMethod
+from ..rpc.utils import build_orchestration_request
 from ..security.cert_manager import generate_subject_alternative_name, load_cert_manager
 
 console = Console()
@@ -858,7 +859,6 @@ def orchestrate(
         if password:
             config.password = password
 
-        from ..rpc.utils import build_orchestration_request
         orchestration_request = build_orchestration_request(
             requester_system_name, requester_address, requester_port, service
         )
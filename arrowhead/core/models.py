@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SystemRegistration(BaseModel):
@@ -19,6 +19,8 @@ class SystemRegistration(BaseModel):
 class System(BaseModel):
     """Arrowhead system model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     system_name: str = Field(alias="systemName")
     address: str
@@ -49,6 +51,8 @@ class ProviderSystem(BaseModel):
 class ServiceDefinition(BaseModel):
     """Service definition model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     service_definition: str = Field(alias="serviceDefinition")
     created_at: datetime = Field(alias="createdAt")
@@ -58,6 +62,8 @@ class ServiceDefinition(BaseModel):
 class Provider(BaseModel):
     """Service provider model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     system_name: str = Field(alias="systemName")
     address: str
@@ -71,6 +77,8 @@ class Provider(BaseModel):
 class Interface(BaseModel):
     """Service interface model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     interface_name: str = Field(alias="interfaceName")
     created_at: datetime = Field(alias="createdAt")
@@ -93,6 +101,8 @@ class ServiceRegistrationRequest(BaseModel):
 class Service(BaseModel):
     """Service model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     service_definition: ServiceDefinition = Field(alias="serviceDefinition")
     provider: Provider
@@ -125,6 +135,8 @@ class AddAuthorizationRequest(BaseModel):
 class Authorization(BaseModel):
     """Authorization model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     consumer_system: System = Field(alias="consumerSystem")
     provider_system: Provider = Field(alias="providerSystem")
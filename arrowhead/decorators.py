@@ -11,12 +11,25 @@ import json
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from .framework import Framework
 from .rpc.config import HTTPMethod
+from .rpc.utils import decode_json, encode_json
 from .service import Params, Service
 
+if TYPE_CHECKING:
+    from .framework import Framework
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -45,7 +58,7 @@ class ArrowheadProvider:
         self.system_name = system_name or _camel_to_kebab(self.__class__.__name__)
         self.base_name = self.system_name
         self.services: List[ServiceInfo] = []
-        self.framework: Optional[Framework] = None
+        self.framework: Optional["Framework"] = None
         self._discover_services()
 
     def _discover_services(self) -> None:
@@ -70,6 +83,10 @@ class ArrowheadProvider:
 
     def start(self) -> None:
         """Start the Arrowhead provider and register all services."""
+        # Imported here so that importing the package does not load the
+        # server stack.
+        from .framework import Framework
+
         try:
             # Create framework
             self.framework = Framework.create_framework()
@@ -157,14 +174,14 @@ class ArrowheadProvider:
             # Create params object
             params = Params(
                 query_params=query_params or {},
-                payload=json.dumps(payload).encode("utf-8") if payload else None,
+                payload=encode_json(payload) if payload else None,
             )
 
             # Send request via framework
             response_bytes = await self.framework.send_request(service_definition, params)
 
             # Parse JSON response
-            return json.loads(response_bytes.decode("utf-8"))
+            return decode_json(response_bytes)
 
         except Exception as e:
             logger.error(f"Service request to '{service_definition}' failed: {e}")
@@ -185,7 +202,7 @@ class ArrowheadProvider:
                     payload_data = {}
                     if params.payload:
                         try:
-                            payload_data = json.loads(params.payload.decode("utf-8"))
+                            payload_data = decode_json(params.payload)
                         except json.JSONDecodeError:
                             # If not JSON, wrap as raw data
                             payload_data = {"raw": params.payload.decode("utf-8")}
@@ -262,14 +279,14 @@ class ArrowheadProvider:
                     elif isinstance(result, str):
                         return result.encode("utf-8")
                     elif isinstance(result, (dict, list)):
-                        return json.dumps(result).encode("utf-8")
+                        return encode_json(result)
                     else:
                         return str(result).encode("utf-8")
 
                 except Exception as e:
                     logger.error(f"Service handler error: {e}")
                     error_response = {"error": str(e)}
-                    return json.dumps(error_response).encode("utf-8")
+                    return encode_json(error_response)
 
         return ServiceWrapper(service_info.handler)
 
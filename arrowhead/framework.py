@@ -3,23 +3,59 @@
 import logging
 import os
 import ssl
-import tempfile
-from typing import Optional
+from types import TracebackType
+from typing import Awaitable, Callable, Optional, Type
 
 import uvicorn
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.serialization import pkcs12
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .rpc.client import ArrowheadClient
 from .rpc.config import HTTPMethod
 from .rpc.utils import build_orchestration_request
+from .security.tls import load_cert_chain_from_memory, load_keystore_pem
 from .service import Params, Service
 
 logger = logging.getLogger(__name__)
 
 
+def _error_response(e: Exception) -> Response:
+    """Build the JSON error response returned when a service handler fails."""
+    logger.error(f"Service handler error: {e}", exc_info=True)
+    return Response(
+        content=f'{{"error": "{str(e)}"}}',
+        status_code=500,
+        media_type="application/json",
+    )
+
+
+def _make_service_handler(
+    service: Service,
+) -> Callable[[Request], Awaitable[Response]]:
+    """Build the FastAPI route handler for a single service endpoint.
+
+    The service's handle_request is looked up once at registration time.
+    The request body is read for every method, as clients may send one with
+    any of them.
+    """
+    handle_request = service.handle_request
+
+    async def service_handler(request: Request) -> Response:
+        """FastAPI route handler for the service."""
+        try:
+            query_params = dict(request.query_params)
+            # TODO: Verify token
+            query_params.pop("token", None)
+            payload = await request.body()
+            params = Params(query_params=query_params, payload=payload or None)
+            response_data = await handle_request(params)
+            return Response(content=response_data, media_type="application/json")
+        except Exception as e:
+            return _error_response(e)
+
+    return service_handler
+
+
 class Framework:
     """Main framework class for Arrowhead applications."""
 
@@ -39,8 +75,6 @@ class Framework:
         self.port: Optional[int] = None
         self.client: Optional[ArrowheadClient] = None
         self.ssl_context: Optional[ssl.SSLContext] = None
-        self.ssl_keyfile: Optional[str] = None
-        self.ssl_certfile: Optional[str] = None
         self.ssl_truststore: Optional[str] = None
 
         # Configure logging
@@ -95,40 +129,17 @@ class Framework:
         self, keystore_path: str, password: Optional[str], truststore_path: str
     ) -> None:
         """Setup TLS configuration for the Uvicorn server."""
-        with open(keystore_path, "rb") as f:
-            p12_data = f.read()
-
-        private_key, cert, additional_certs = pkcs12.load_key_and_certificates(
-            p12_data, password.encode() if password else None
-        )
-
-        if private_key is None or cert is None:
-            raise ValueError("Failed to load private key or certificate from keystore")
-
-        cert_chain = [cert]
-        if additional_certs:
-            cert_chain.extend(additional_certs)
-
-        self._temp_dir = tempfile.TemporaryDirectory()
-        temp_dir_path = self._temp_dir.name
-        
-        from pathlib import Path
-        self.ssl_certfile = str(Path(temp_dir_path) / "cert.pem")
-        self.ssl_keyfile = str(Path(temp_dir_path) / "key.pem")
         self.ssl_truststore = truststore_path
+        cert_bytes, key_bytes = load_keystore_pem(keystore_path, password)
 
-        with open(self.ssl_certfile, "wb") as cert_file:
-            for certificate in cert_chain:
-                cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
-
-        key_bytes = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
+        # Require mutual TLS 1.3; resumed handshakes then skip the certificate
+        # signature entirely.
+        self.ssl_context = ssl.create_default_context(
+            ssl.Purpose.CLIENT_AUTH, cafile=truststore_path
         )
-        key_fd = os.open(self.ssl_keyfile, os.O_WRONLY | os.O_CREAT, 0o600)
-        with os.fdopen(key_fd, "wb") as key_file:
-            key_file.write(key_bytes)
+        self.ssl_context.minimum_version = ssl.TLSVersion.TLSv1_3
+        self.ssl_context.verify_mode = ssl.CERT_REQUIRED
+        load_cert_chain_from_memory(self.ssl_context, cert_bytes, key_bytes)
 
     def handle_service(
         self,
@@ -140,30 +151,12 @@ class Framework:
         """Register a service handler with the framework."""
         logger.debug(f"Registering service: {service_definition} at {service_uri}")
 
-        async def service_handler(request: Request):
-            """FastAPI route handler for the service."""
-            try:
-                query_params = dict(request.query_params)
-                if "token" in query_params:
-                    # TODO: Verify token
-                    del query_params["token"]
-
-                payload = await request.body()
-                params = Params(query_params=query_params, payload=payload if payload else None)
-                
-                # Await the async handler
-                response_data = await service.handle_request(params)
-
-                return Response(content=response_data, media_type="application/json")
-
-            except Exception as e:
-                logger.error(f"Service handler error: {e}", exc_info=True)
-                return Response(content=f'{{"error": "{str(e)}"}}', status_code=500, media_type="application/json")
+        service_handler = _make_service_handler(service)
 
         self.app.add_api_route(
             path=service_uri,
             endpoint=service_handler,
-            methods=[str(http_method)]
+            methods=[http_method.name],
         )
 
     async def send_request(self, service_def: str, params: Optional[Params] = None) -> bytes:
@@ -204,16 +197,12 @@ class Framework:
             log_level="info",
         )
 
-        if self.ssl_keyfile and self.ssl_certfile and self.ssl_truststore:
+        if self.ssl_context is not None:
             logger.info(f"Starting HTTPS server with mTLS on {host}:{port}")
-            uvicorn_config.ssl_keyfile = self.ssl_keyfile
-            uvicorn_config.ssl_certfile = self.ssl_certfile
-            
-            # Use the truststore to verify client certificates
-            uvicorn_config.ssl_ca_certs = self.ssl_truststore
-            
-            # Enforce that clients MUST present a valid certificate
-            uvicorn_config.ssl_cert_reqs = ssl.CERT_REQUIRED
+            # Uvicorn only builds contexts from file paths, so load the config
+            # first and then install the context prepared in _setup_tls.
+            uvicorn_config.load()
+            uvicorn_config.ssl = self.ssl_context
         else:
             logger.info(f"Starting HTTP server on {host}:{port}")
 
@@ -233,8 +222,18 @@ class Framework:
         if self.client:
             await self.client.aclose()
 
-        if hasattr(self, "_temp_dir"):
-            try:
-                self._temp_dir.cleanup()
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp dir: {e}")
+    # Implement async context manager protocol, so a consumer can keep one
+    # framework, and with it one pooled HTTP client, for its whole scope.
+    async def __aenter__(self) -> "Framework":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        del exc_type
+        del exc_val
+        del exc_tb
+        await self.aclose()
@@ -1,95 +1,141 @@
 """Main RPC client for Arrowhead Framework."""
 
 import logging
-import os
-import tempfile
-from typing import Dict, Optional
+import ssl
+from typing import Any, Collection, Dict, Optional, Tuple
 
 import httpx
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.serialization import pkcs12
 
 from ..core.models import (
     MatchedService,
     OrchestrationRequest,
     OrchestrationResponse,
 )
+from ..security.tls import (
+    keystore_fingerprint,
+    load_cert_chain_from_memory,
+    load_keystore_pem,
+)
 from .config import Config
 from .management import ManagementAPI
 
 
 logger = logging.getLogger(__name__)
 
+# Keep enough warm connections for management flows that issue many
+# sequential calls, so they do not pay a new TCP+TLS handshake each time.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=60.0
+)
+# We must set a timeout, otherwise requests can hang indefinitely.
+_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Client SSL contexts shared by every ArrowheadClient with the same keystore,
+# truststore and verification settings, so the keystore is only loaded once.
+_ssl_contexts: Dict[Tuple[Any, ...], ssl.SSLContext] = {}
+
 
 class ArrowheadClient:
     """Main client for Arrowhead Framework communication."""
 
-    def __init__(self, config: Config) -> None:
-        """Initialize the client with configuration."""
+    # Default request headers, shared by every call without overrides. The
+    # Content-Type is only sent with requests that carry a body.
+    _JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+    _ACCEPT_JSON_HEADERS = {"Accept": "application/json"}
+
+    def __init__(
+        self, config: Config, http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """Initialize the client with configuration.
+
+        Args:
+            config: Client configuration
+            http_client: Optional long-lived HTTP client to use instead of
+                creating one. It is not closed by ``aclose``.
+        """
         self.config = config
-        self._temp_files = []
-        self.client = self._create_async_http_client()
+        self._base_urls = self._build_base_urls()
+        self._owns_client = http_client is None
+        self.client = http_client or self._create_async_http_client()
         self.management = ManagementAPI(self)
 
     def _create_async_http_client(self) -> httpx.AsyncClient:
-        """Create an async HTTP client with TLS configuration."""
+        """Create an async HTTP client, with TLS configuration.
+
+        The client is bound to the event loop it is first used on, so it is
+        not shared between instances. Pass ``http_client`` to reuse one.
+        """
+        verify: Any
         if not self.config.tls:
             logger.debug("TLS disabled. Creating insecure httpx client.")
-            return httpx.AsyncClient(verify=False)
+            verify = False
+        else:
+            if not (self.config.keystore_path and self.config.truststore_path):
+                raise ValueError("Keystore and truststore paths are required for TLS.")
 
-        if not (self.config.keystore_path and self.config.truststore_path):
-            raise ValueError("Keystore and truststore paths are required for TLS.")
+            logger.debug(
+                f"TLS enabled. Keystore: {self.config.keystore_path}, Truststore: {self.config.truststore_path}"
+            )
+            verify = self._create_ssl_context()
 
-        logger.debug(
-            f"TLS enabled. Keystore: {self.config.keystore_path}, Truststore: {self.config.truststore_path}"
+        return httpx.AsyncClient(
+            verify=verify,
+            http2=self.config.tls,
+            limits=_POOL_LIMITS,
+            timeout=_TIMEOUT,
         )
 
-        with open(self.config.keystore_path, "rb") as f:
-            p12_data = f.read()
-
-        private_key, cert, additional_certs = pkcs12.load_key_and_certificates(
-            p12_data, self.config.password.encode() if self.config.password else None
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """Get the shared client SSL context holding the keystore's cert and key."""
+        assert self.config.keystore_path is not None
+        context_key = (
+            keystore_fingerprint(self.config.keystore_path, self.config.password),
+            self.config.truststore_path,
+            self.config.verify_ssl,
         )
+        ssl_context = _ssl_contexts.get(context_key)
+        if ssl_context is not None:
+            return ssl_context
 
-        if private_key is None or cert is None:
-            raise ValueError("Failed to load private key or certificate from keystore")
-
-        cert_chain = [cert]
-        if additional_certs:
-            cert_chain.extend(additional_certs)
-
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".pem") as cert_file:
-            for certificate in cert_chain:
-                cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
-            cert_path = cert_file.name
-            self._temp_files.append(cert_path)
-
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".key") as key_file:
-            key_file.write(
-                private_key.private_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption(),
-                )
+        if self.config.verify_ssl:
+            ssl_context = ssl.create_default_context(
+                cafile=self.config.truststore_path
             )
-            key_path = key_file.name
-            self._temp_files.append(key_path)
+        else:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
 
-        certs = (cert_path, key_path)
-        verify = self.config.truststore_path if self.config.verify_ssl else False
-
-        return httpx.AsyncClient(cert=certs, verify=verify)
+        cert_pem, key_pem = load_keystore_pem(
+            self.config.keystore_path, self.config.password
+        )
+        load_cert_chain_from_memory(ssl_context, cert_pem, key_pem)
+
+        # Drop contexts built from older versions of the same keystore file.
+        fingerprint = context_key[0]
+        path = fingerprint[0]
+        for stale_key in [
+            k for k in _ssl_contexts if k[0][0] == path and k[0] != fingerprint
+        ]:
+            del _ssl_contexts[stale_key]
+        _ssl_contexts[context_key] = ssl_context
+        return ssl_context
+
+    def _build_base_urls(self) -> Dict[str, str]:
+        """Build the base URL of each core service API."""
+        protocol = "https" if self.config.tls else "http"
+        return {
+            "serviceregistry": f"{protocol}://{self.config.service_registry_host}:{self.config.service_registry_port}/serviceregistry",
+            "orchestrator": f"{protocol}://{self.config.orchestrator_host}:{self.config.orchestrator_port}/orchestrator",
+            "authorization": f"{protocol}://{self.config.authorization_host}:{self.config.authorization_port}/authorization",
+        }
 
     def _build_url(self, service: str, path: str) -> str:
         """Build URL for a core service API."""
-        protocol = "https" if self.config.tls else "http"
-        if service == "serviceregistry":
-            return f"{protocol}://{self.config.service_registry_host}:{self.config.service_registry_port}/serviceregistry{path}"
-        elif service == "orchestrator":
-            return f"{protocol}://{self.config.orchestrator_host}:{self.config.orchestrator_port}/orchestrator{path}"
-        elif service == "authorization":
-            return f"{protocol}://{self.config.authorization_host}:{self.config.authorization_port}/authorization{path}"
-        raise ValueError(f"Unknown core service: {service}")
+        try:
+            return self._base_urls[service] + path
+        except KeyError:
+            raise ValueError(f"Unknown core service: {service}") from None
 
     async def _make_request(
         self,
@@ -97,20 +143,37 @@ class ArrowheadClient:
         url: str,
         expected_status: int = 200,
         error_msg: str = "Request failed",
+        headers: Optional[Dict[str, str]] = None,
+        quiet_statuses: Collection[int] = (),
         **kwargs,
     ) -> httpx.Response:
-        """Make an async HTTP request with error handling."""
+        """Make an async HTTP request with error handling.
+
+        The given headers are merged over the default JSON headers, which
+        only include Content-Type when the request has a body. Responses
+        with a status in quiet_statuses still raise, but are not logged; use
+        it for statuses the caller expects and handles.
+        """
+        has_body = kwargs.get("content") is not None or "json" in kwargs
+        default_headers = self._JSON_HEADERS if has_body else self._ACCEPT_JSON_HEADERS
+        request_headers = {**default_headers, **headers} if headers else default_headers
         try:
-            # We must set a timeout, otherwise requests can hang indefinitely.
-            response = await self.client.request(method, url, timeout=10.0, **kwargs)
+            response = await self.client.request(
+                method, url, headers=request_headers, **kwargs
+            )
             if response.status_code != expected_status:
-                logger.error(f"{error_msg}: {response.status_code} - {response.text}")
-                # Try to parse and log a more specific error from the body if possible
-                try:
-                    error_json = response.json()
-                    logger.error(f"Server error details: {error_json}")
-                except Exception:
-                    pass
+                # Only decode the body when the error will actually be logged.
+                quiet = response.status_code in quiet_statuses
+                if not quiet and logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        f"{error_msg}: {response.status_code} - {response.text}"
+                    )
+                    # Try to parse and log a more specific error from the body if possible
+                    try:
+                        error_json = response.json()
+                        logger.error(f"Server error details: {error_json}")
+                    except Exception:
+                        pass
                 response.raise_for_status()
             return response
         except httpx.ConnectError as e:
@@ -125,16 +188,15 @@ class ArrowheadClient:
     ) -> OrchestrationResponse:
         """Request service orchestration."""
         url = self._build_url("orchestrator", "/orchestration")
-        data = orchestration_req.model_dump(by_alias=True)
+        data = orchestration_req.model_dump_json(by_alias=True).encode()
 
         response = await self._make_request(
             "POST",
             url,
             error_msg="Failed to orchestrate",
-            json=data,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            content=data,
         )
-        return OrchestrationResponse(**response.json())
+        return OrchestrationResponse.model_validate_json(response.content)
 
     async def send_request(
         self,
@@ -167,19 +229,13 @@ class ArrowheadClient:
             error_msg="Failed to send service request",
             params=request_params,
             content=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
         )
         return response.content
 
     async def aclose(self) -> None:
         """Asynchronously close the client and clean up resources."""
-        await self.client.aclose()
-        for temp_file in self._temp_files:
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
-        self._temp_files.clear()
+        if self._owns_client:
+            await self.client.aclose()
         
     # Implement async context manager protocol
     async def __aenter__(self) -> "ArrowheadClient":
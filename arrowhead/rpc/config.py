@@ -15,12 +15,7 @@ class HTTPMethod(IntEnum):
 
     def __str__(self) -> str:
         """Convert to string representation."""
-        return {
-            HTTPMethod.GET: "GET",
-            HTTPMethod.POST: "POST",
-            HTTPMethod.PUT: "PUT",
-            HTTPMethod.DELETE: "DELETE",
-        }[self]
+        return self.name
 
 
 @dataclass
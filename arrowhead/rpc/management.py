@@ -1,85 +1,257 @@
 """Management API for Arrowhead Framework."""
 
+import asyncio
+import functools
 import logging
-from typing import TYPE_CHECKING, List
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from urllib.parse import quote
+
+import httpx
+from pydantic import BaseModel, Field
 
 from ..core.models import (
     AddAuthorizationRequest,
     Authorization,
     AuthorizationsResponse,
     Service,
-    ServiceRegistrationRequest,
     ServicesResponse,
     System,
     SystemRegistration,
     SystemsResponse,
 )
 from .config import HTTPMethod
+from .utils import encode_json
 
 if TYPE_CHECKING:
     from .client import ArrowheadClient
 
 logger = logging.getLogger(__name__)
 
+# Header override sent with the system and service GETs; the authorization
+# list keeps the client's default JSON Accept header.
+_ACCEPT_ANY = {"Accept": "*/*"}
+
+# Management API paths, relative to the core system base URLs.
+_SYSTEMS_PATH = "/mgmt/systems"
+_SYSTEMS_LIST_PATH = "/mgmt/systems?direction=ASC&sort_field=id"
+_SYSTEM_PATH = "/mgmt/systems/%d"
+_SERVICES_PATH = "/mgmt/services"
+_SERVICES_LIST_PATH = "/mgmt/services?direction=ASC&sort_field=id"
+_SERVICES_PAGE_PATH = (
+    "/mgmt/services?direction=ASC&sort_field=id&page=%d&item_per_page=%d"
+)
+_SERVICE_PATH = "/mgmt/services/%d"
+_SERVICEDEF_PATH = "/mgmt/servicedef/%s"
+_AUTHORIZATIONS_PATH = "/mgmt/intracloud"
+_AUTHORIZATIONS_LIST_PATH = "/mgmt/intracloud?direction=ASC&sort_field=id"
+_AUTHORIZATION_PATH = "/mgmt/intracloud/%d"
+
+# Fixed parts of service registration payloads. They are only serialized,
+# never mutated, so every registration shares them.
+_HTTP_METHOD_METADATA = {method: {"http-method": str(method)} for method in HTTPMethod}
+_SERVICE_INTERFACES = ["HTTP-SECURE-JSON"]
+
+T = TypeVar("T")
+
+
+class _IdView(BaseModel):
+    """Identifier of a nested provider or interface."""
+
+    id: int
+
+
+class _ServiceDefinitionView(BaseModel):
+    """Service definition with the fields used for matching."""
+
+    id: int
+    service_definition: str = Field(alias="serviceDefinition")
+
+
+class _ServiceIdView(BaseModel):
+    """The parts of a service needed to build authorization rules."""
+
+    provider: _IdView
+    service_definition: _ServiceDefinitionView = Field(alias="serviceDefinition")
+    interfaces: List[_IdView]
+
+
+class _ServiceIdsResponse(BaseModel):
+    """Services listing parsed into _ServiceIdView entries only."""
+
+    services: List[_ServiceIdView] = Field(alias="data")
+
+
+# Either a full service or its ID view, as accepted by the ID helpers.
+_ServiceView = Union[Service, _ServiceIdView]
+
+
+class _ServicesIndex(NamedTuple):
+    """Lookup indexes over a services listing snapshot."""
+
+    by_provider: Dict[int, List[Service]]
+    by_definition: Dict[str, List[Service]]
+
 
 class ManagementAPI:
     """Management API for administrative operations."""
 
-    def __init__(self, client: "ArrowheadClient") -> None:
-        """Initialize with client reference."""
+    def __init__(self, client: "ArrowheadClient", cache_ttl: float = 5.0) -> None:
+        """Initialize with client reference.
+
+        Args:
+            client: Client used to issue requests
+            cache_ttl: Seconds a systems, services or authorizations listing is
+                reused before it is fetched again. Use 0 to disable caching.
+        """
         self.client = client
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, "asyncio.Future[Any]"]] = {}
+        self._servicedef_endpoint_supported = True
+
+        # Request helpers with the per-method arguments applied once.
+        self._get = functools.partial(
+            client._make_request, "GET", headers=_ACCEPT_ANY
+        )
+        self._post = functools.partial(
+            client._make_request, "POST", expected_status=201
+        )
+        self._delete = functools.partial(client._make_request, "DELETE")
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached result for key, fetching it when missing or stale.
+
+        The pending fetch itself is cached, so concurrent callers share a
+        single request. A failed or cancelled fetch is evicted as soon as it
+        completes, whether or not the caller that started it is still waiting.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return cast(T, await asyncio.shield(entry[1]))
+
+        future = asyncio.ensure_future(fetch())
+        self._cache[key] = (time.monotonic(), future)
+
+        def evict_on_error(done: "asyncio.Future[Any]") -> None:
+            if done.cancelled() or done.exception() is not None:
+                if self._cache.get(key, (0.0, None))[1] is done:
+                    del self._cache[key]
+
+        future.add_done_callback(evict_on_error)
+        return await asyncio.shield(future)
+
+    async def _gather_bounded(
+        self, calls: Iterable[Callable[[], Awaitable[T]]], concurrency: int
+    ) -> List[T]:
+        """Run calls concurrently, at most `concurrency` at a time, in order.
+
+        If a call fails, the calls still pending or in flight are cancelled
+        and awaited before its error is raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(call: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                return await call()
+
+        tasks = [asyncio.ensure_future(bounded(call)) for call in calls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _invalidate(self, *keys: str) -> None:
+        """Drop cached listings affected by a mutation."""
+        for key in keys:
+            self._cache.pop(key, None)
 
     async def register_system(self, system_reg: SystemRegistration) -> System:
         """Register a system via management API."""
-        url = self.client._build_url("serviceregistry", "/mgmt/systems")
-        data = system_reg.model_dump(by_alias=True)
+        url = self.client._build_url("serviceregistry", _SYSTEMS_PATH)
+        data = system_reg.model_dump_json(by_alias=True).encode()
 
-        response = await self.client._make_request(
-            "POST",
+        response = await self._post(
             url,
-            expected_status=201,
             error_msg="Failed to register system",
-            json=data,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            content=data,
         )
 
-        return System(**response.json())
+        self._invalidate("systems")
+        return System.model_validate_json(response.content)
 
     async def unregister_system_by_id(self, system_id: int) -> None:
         """Unregister a system by ID."""
-        url = self.client._build_url("serviceregistry", f"/mgmt/systems/{system_id}")
-        await self.client._make_request(
-            "DELETE",
+        url = self.client._build_url("serviceregistry", _SYSTEM_PATH % system_id)
+        await self._delete(
             url,
             error_msg="Failed to unregister system",
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
         )
+        # Services and authorization rules of the removed system are dropped
+        # by the core systems as well.
+        self._invalidate("systems", "services", "authorizations")
 
     async def get_systems(self) -> List[System]:
-        """Get all registered systems."""
-        url = self.client._build_url("serviceregistry", "/mgmt/systems?direction=ASC&sort_field=id")
-        response = await self.client._make_request("GET", url, error_msg="Failed to get systems", headers={"Accept": "*/*"})
-        systems_response = SystemsResponse(**response.json())
-        return systems_response.systems
+        """Get all registered systems.
+
+        The list is a copy, so callers may sort or modify it.
+        """
+        systems, _ = await self._get_systems_indexed()
+        return list(systems)
+
+    async def _get_systems_indexed(self) -> Tuple[List[System], Dict[str, System]]:
+        """Get all registered systems together with an index by system name."""
+        return await self._cached("systems", self._fetch_systems)
+
+    async def _fetch_systems(self) -> Tuple[List[System], Dict[str, System]]:
+        """Fetch all registered systems from the service registry."""
+        url = self.client._build_url("serviceregistry", _SYSTEMS_LIST_PATH)
+        response = await self._get(url, error_msg="Failed to get systems")
+        systems_response = SystemsResponse.model_validate_json(response.content)
+        systems = systems_response.systems
+        # Built in reverse so the first system with a given name wins.
+        systems_by_name = {system.system_name: system for system in reversed(systems)}
+        return systems, systems_by_name
 
     async def get_system_by_id(self, system_id: int) -> System:
         """Get system by ID."""
-        url = self.client._build_url("serviceregistry", f"/mgmt/systems/{system_id}")
-        response = await self.client._make_request(
-            "GET", url, error_msg="Failed to get system", headers={"Accept": "*/*"}
-        )
+        url = self.client._build_url("serviceregistry", _SYSTEM_PATH % system_id)
+        response = await self._get(url, error_msg="Failed to get system")
 
-        return System(**response.json())
+        return System.model_validate_json(response.content)
 
     async def get_system_by_name(self, system_name: str) -> System:
         """Get system by name."""
-        systems = await self.get_systems()
+        systems = await self._lookup_systems_by_name((system_name,))
+        return systems[system_name]
 
-        for system in systems:
-            if system.system_name == system_name:
-                return system
+    async def _lookup_systems_by_name(self, names: Iterable[str]) -> Dict[str, System]:
+        """Resolve several system names from a single systems listing."""
+        _, systems_by_name = await self._get_systems_indexed()
 
-        raise ValueError(f"System with name {system_name} not found")
+        try:
+            return {name: systems_by_name[name] for name in names}
+        except KeyError as e:
+            raise ValueError(f"System with name {e.args[0]} not found") from None
 
     async def register_service(
         self,
@@ -89,110 +261,331 @@ class ManagementAPI:
         service_uri: str,
     ) -> Service:
         """Register a service via management API."""
-        from ..core.models import ProviderSystem
-
-        provider_system = ProviderSystem(
-            systemName=system.system_name,
-            address=system.address,
-            port=system.port,
-            authenticationInfo=system.authentication_info or "",
-            metadata=system.metadata,
-        )
-
-        service_reg = ServiceRegistrationRequest(
-            endOfValidity="",
-            interfaces=["HTTP-SECURE-JSON"],
-            metadata={"http-method": str(http_method)},
-            providerSystem=provider_system,
-            secure="TOKEN",
-            serviceDefinition=service_definition,
-            serviceUri=service_uri,
-            version="1",
-        )
-
-        url = self.client._build_url("serviceregistry", "/mgmt/services")
-        data = service_reg.model_dump(by_alias=True)
-
-        response = await self.client._make_request(
-            "POST",
+        # The request has a fixed shape, so it is written out directly
+        # instead of being built and validated through pydantic models.
+        service_reg = {
+            "endOfValidity": "",
+            "interfaces": _SERVICE_INTERFACES,
+            "metadata": _HTTP_METHOD_METADATA[http_method],
+            "providerSystem": {
+                "systemName": system.system_name,
+                "address": system.address,
+                "port": system.port,
+                "authenticationInfo": system.authentication_info or "",
+                "metadata": system.metadata,
+            },
+            "secure": "TOKEN",
+            "serviceDefinition": service_definition,
+            "serviceUri": service_uri,
+            "version": "1",
+        }
+
+        url = self.client._build_url("serviceregistry", _SERVICES_PATH)
+        data = encode_json(service_reg)
+
+        response = await self._post(
             url,
-            expected_status=201,
             error_msg="Failed to register service",
-            json=data,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            content=data,
+        )
+        self._invalidate("services")
+        return Service.model_validate_json(response.content)
+
+    async def register_services(
+        self,
+        registrations: Iterable[Tuple[System, HTTPMethod, str, str]],
+        concurrency: int = 16,
+    ) -> List[Service]:
+        """Register several services concurrently.
+
+        Args:
+            registrations: (system, http_method, service_definition, service_uri)
+                tuples, as taken by register_service
+            concurrency: Maximum number of registration requests in flight
+
+        Returns:
+            The registered services, in the order of registrations. If a
+            registration fails, the registrations not yet completed are
+            cancelled and its error is raised. Completed registrations are
+            not rolled back.
+        """
+        return await self._gather_bounded(
+            (
+                functools.partial(self.register_service, *registration)
+                for registration in registrations
+            ),
+            concurrency,
         )
-        return Service(**response.json())
 
     async def unregister_service(self, service_id: int) -> None:
         """Unregister service by ID."""
-        url = self.client._build_url("serviceregistry", f"/mgmt/services/{service_id}")
-        await self.client._make_request(
-            "DELETE",
+        url = self.client._build_url("serviceregistry", _SERVICE_PATH % service_id)
+        await self._delete(
             url,
             error_msg="Failed to unregister service",
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        self._invalidate("services")
+
+    async def unregister_services(
+        self, service_ids: Iterable[int], concurrency: int = 16
+    ) -> None:
+        """Unregister several services by ID concurrently.
+
+        Args:
+            service_ids: IDs of the services to unregister
+            concurrency: Maximum number of requests in flight
+
+        If a removal fails, the removals not yet completed are cancelled and
+        its error is raised. Services already removed stay removed.
+        """
+        await self._gather_bounded(
+            (
+                functools.partial(self.unregister_service, service_id)
+                for service_id in service_ids
+            ),
+            concurrency,
         )
 
     async def get_services(self) -> List[Service]:
-        """Get all registered services."""
-        url = self.client._build_url("serviceregistry", "/mgmt/services?direction=ASC&sort_field=id")
-        response = await self.client._make_request(
-            "GET", url, error_msg="Failed to get services", headers={"Accept": "*/*"}
+        """Get all registered services.
+
+        The list is a copy, so callers may sort or modify it.
+        """
+        services, _ = await self._get_services_indexed()
+        return list(services)
+
+    async def _get_services_indexed(self) -> Tuple[List[Service], _ServicesIndex]:
+        """Get all registered services together with lookup indexes."""
+        return await self._cached("services", self._fetch_services)
+
+    async def _fetch_services(self) -> Tuple[List[Service], _ServicesIndex]:
+        """Fetch all registered services from the service registry."""
+        url = self.client._build_url("serviceregistry", _SERVICES_LIST_PATH)
+        response = await self._get(url, error_msg="Failed to get services")
+        services_response = ServicesResponse.model_validate_json(response.content)
+        services = services_response.services
+
+        # Index the snapshot once so lookups by provider or definition do not
+        # rescan the whole listing. Each index keeps the listing order.
+        index = _ServicesIndex(by_provider={}, by_definition={})
+        for service in services:
+            index.by_provider.setdefault(service.provider.id, []).append(service)
+            index.by_definition.setdefault(
+                service.service_definition.service_definition, []
+            ).append(service)
+        return services, index
+
+    async def iter_services(self, page_size: int = 100) -> AsyncIterator[Service]:
+        """Iterate over all registered services, one page at a time.
+
+        Unlike get_services, only a single page of the listing is held in
+        memory, so large registries can be scanned with a flat memory profile.
+
+        Args:
+            page_size: Number of services requested per page
+        """
+        page = 0
+        received = 0
+        while True:
+            url = self.client._build_url(
+                "serviceregistry", _SERVICES_PAGE_PATH % (page, page_size)
+            )
+            response = await self._get(url, error_msg="Failed to get services")
+            services_response = ServicesResponse.model_validate_json(response.content)
+            for service in services_response.services:
+                yield service
+
+            # count is the total number of services. A page of any other size
+            # is either the last one or the whole listing from a server that
+            # does not paginate.
+            received += len(services_response.services)
+            if (
+                len(services_response.services) != page_size
+                or received >= services_response.count
+            ):
+                return
+            page += 1
+
+    async def get_services_by_definition(self, service_def: str) -> List[Service]:
+        """Get the services registered for a service definition.
+
+        The registry filters the listing server side, and an unknown service
+        definition yields an empty list. Registries without the servicedef
+        endpoint are handled by filtering the full listing instead.
+        """
+        services = await self._query_services_by_definition(
+            service_def, ServicesResponse
+        )
+        return cast(List[Service], services)
+
+    async def _get_service_ids_by_definition(
+        self, service_def: str
+    ) -> Sequence[_ServiceView]:
+        """Get the IDs of the services registered for a service definition.
+
+        Like get_services_by_definition, but only the fields needed to build
+        authorization rules are validated.
+        """
+        services = await self._query_services_by_definition(
+            service_def, _ServiceIdsResponse
         )
-        services_response = ServicesResponse(**response.json())
-        return services_response.services
+        return cast(Sequence[_ServiceView], services)
+
+    async def _query_services_by_definition(
+        self,
+        service_def: str,
+        response_model: Union[Type[ServicesResponse], Type[_ServiceIdsResponse]],
+    ) -> Any:
+        """Fetch the services of a definition, parsed as response_model."""
+        if self._servicedef_endpoint_supported:
+            url = self.client._build_url(
+                "serviceregistry", _SERVICEDEF_PATH % quote(service_def, safe="")
+            )
+            try:
+                # 404: endpoint not offered; 400: unknown service definition.
+                # Both are handled below, so they are not logged as errors.
+                response = await self._get(
+                    url,
+                    error_msg="Failed to get services by definition",
+                    quiet_statuses=(400, 404),
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 400:
+                    return []
+                if e.response.status_code != 404:
+                    raise
+                self._servicedef_endpoint_supported = False
+            else:
+                services_response = response_model.model_validate_json(
+                    response.content
+                )
+                return services_response.services
+
+        _, index = await self._get_services_indexed()
+        return list(index.by_definition.get(service_def, ()))
 
     async def get_service_by_id(self, service_id: int) -> Service:
         """Get service by ID."""
-        url = self.client._build_url("serviceregistry", f"/mgmt/services/{service_id}")
-        response = await self.client._make_request(
-            "GET", url, error_msg="Failed to get service", headers={"Accept": "*/*"}
-        )
-        return Service(**response.json())
+        url = self.client._build_url("serviceregistry", _SERVICE_PATH % service_id)
+        response = await self._get(url, error_msg="Failed to get service")
+        return Service.model_validate_json(response.content)
 
     async def get_service_definition_ids_for_provider(
-        self, provider_id: int, service_def: str
+        self,
+        provider_id: int,
+        service_def: str,
+        services: Optional[Sequence[Service]] = None,
     ) -> List[int]:
-        """Get service definition IDs for a provider."""
-        services = await self.get_services()
+        """Get service definition IDs for a provider.
+
+        Args:
+            provider_id: ID of the provider system
+            service_def: Service definition name to match
+            services: Already fetched services to search instead of fetching them
+        """
+        candidates: Sequence[_ServiceView]
+        if services is None:
+            # The registry filters by service definition, not by provider.
+            candidates = await self._get_service_ids_by_definition(service_def)
+        else:
+            candidates = services
+        service_definition_ids, _ = self._provider_service_view(
+            provider_id, service_def, candidates
+        )
+        return service_definition_ids
+
+    async def get_interface_ids_for_provider(
+        self, provider_id: int, services: Optional[List[Service]] = None
+    ) -> List[int]:
+        """Get interface IDs for a provider.
+
+        Args:
+            provider_id: ID of the provider system
+            services: Already fetched services to search instead of fetching them
+        """
+        if services is None:
+            _, index = await self._get_services_indexed()
+            services = index.by_provider.get(provider_id, [])
+        _, interface_ids = self._provider_service_view(provider_id, None, services)
+        return interface_ids
+
+    def _provider_service_view(
+        self,
+        provider_id: int,
+        service_def: Optional[str],
+        services: Sequence[_ServiceView],
+    ) -> Tuple[List[int], List[int]]:
+        """Collect a provider's service definition and interface IDs in one pass.
+
+        Args:
+            provider_id: ID of the provider system
+            service_def: Service definition name to match, or None for all
+            services: Services to search
+
+        Returns:
+            The service definition IDs of the provider's services matching
+            service_def, and the distinct interface IDs of all the provider's
+            services.
+        """
         service_definition_ids = []
+        # A dict drops duplicates in linear time and keeps first-seen order.
+        interface_ids: Dict[int, None] = {}
         for service in services:
+            if service.provider.id != provider_id:
+                continue
             if (
-                service.provider.id == provider_id
-                and service.service_definition.service_definition == service_def
+                service_def is None
+                or service.service_definition.service_definition == service_def
             ):
                 service_definition_ids.append(service.service_definition.id)
-        return service_definition_ids
-
-    async def get_interface_ids_for_provider(self, provider_id: int) -> List[int]:
-        """Get interface IDs for a provider."""
-        services = await self.get_services()
-        interface_ids = []
-        for service in services:
-            if service.provider.id == provider_id:
-                for interface in service.interfaces:
-                    if interface.id not in interface_ids:
-                        interface_ids.append(interface.id)
-        return interface_ids
+            for interface in service.interfaces:
+                interface_ids[interface.id] = None
+        return service_definition_ids, list(interface_ids)
 
     async def add_authorization(
         self, consumer_name: str, provider_name: str, service_def: str
     ) -> Authorization:
         """Add authorization rule."""
-        consumer = await self.get_system_by_name(consumer_name)
-        provider = await self.get_system_by_name(provider_name)
+        # The lookups are independent, so issue them concurrently. Both systems
+        # come from one systems listing, and the rule covers every interface
+        # of the provider, so its services are taken from the full listing.
+        systems, (_, index) = await asyncio.gather(
+            self._lookup_systems_by_name((consumer_name, provider_name)),
+            self._get_services_indexed(),
+        )
+        provider = systems[provider_name]
+        return await self._post_authorization(
+            systems[consumer_name],
+            provider,
+            service_def,
+            index.by_provider.get(provider.id, []),
+        )
 
-        service_definition_ids = await self.get_service_definition_ids_for_provider(
-            provider.id, service_def
+    async def _post_authorization(
+        self,
+        consumer: System,
+        provider: System,
+        service_def: str,
+        services: Sequence[_ServiceView],
+    ) -> Authorization:
+        """Add an authorization rule between resolved systems.
+
+        Args:
+            consumer: Consumer system
+            provider: Provider system
+            service_def: Service definition name
+            services: The provider's services to take the IDs from
+        """
+        provider_name = provider.system_name
+        service_definition_ids, interface_ids = self._provider_service_view(
+            provider.id, service_def, services
         )
         if not service_definition_ids:
             raise ValueError(f"No service definition '{service_def}' found for provider '{provider_name}'")
 
-        interface_ids = await self.get_interface_ids_for_provider(provider.id)
         if not interface_ids:
             raise ValueError(f"No interfaces found for provider '{provider_name}'")
 
-
         auth_req = AddAuthorizationRequest(
             consumerId=consumer.id,
             providerIds=[provider.id],
@@ -200,42 +593,108 @@ class ManagementAPI:
             interfaceIds=interface_ids,
         )
 
-        url = self.client._build_url("authorization", "/mgmt/intracloud")
-        data = auth_req.model_dump(by_alias=True)
+        url = self.client._build_url("authorization", _AUTHORIZATIONS_PATH)
+        data = auth_req.model_dump_json(by_alias=True).encode()
 
-        response = await self.client._make_request(
-            "POST",
+        response = await self._post(
             url,
-            expected_status=201,
             error_msg="Failed to add authorization rule",
-            json=data,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            content=data,
         )
-        auth_response = AuthorizationsResponse(**response.json())
+        self._invalidate("authorizations")
+        auth_response = AuthorizationsResponse.model_validate_json(response.content)
 
         if not auth_response.authorizations:
             raise ValueError("Failed to add authorization rule: API returned empty list.")
 
         return auth_response.authorizations[0]
 
+    async def add_authorizations(
+        self, rules: Iterable[Tuple[str, str, str]], concurrency: int = 16
+    ) -> List[Authorization]:
+        """Add several authorization rules concurrently.
+
+        The systems and services listings are fetched once for the whole
+        batch.
+
+        Args:
+            rules: (consumer_name, provider_name, service_def) tuples, as taken
+                by add_authorization
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            The added rules, in the order of rules. If a rule fails, the rules
+            not yet added are cancelled and its error is raised. Rules already
+            added are not rolled back.
+        """
+        rules = list(rules)
+
+        systems, (_, index) = await asyncio.gather(
+            self._lookup_systems_by_name(
+                name
+                for consumer_name, provider_name, _ in rules
+                for name in (consumer_name, provider_name)
+            ),
+            self._get_services_indexed(),
+        )
+
+        return await self._gather_bounded(
+            (
+                functools.partial(
+                    self._post_authorization,
+                    systems[consumer_name],
+                    systems[provider_name],
+                    service_def,
+                    index.by_provider.get(systems[provider_name].id, []),
+                )
+                for consumer_name, provider_name, service_def in rules
+            ),
+            concurrency,
+        )
+
     async def get_authorizations(self) -> List[Authorization]:
-        """Get all authorization rules."""
-        url = self.client._build_url("authorization", "/mgmt/intracloud?direction=ASC&sort_field=id")
+        """Get all authorization rules.
+
+        The list is a copy, so callers may sort or modify it.
+        """
+        return list(
+            await self._cached("authorizations", self._fetch_authorizations)
+        )
+
+    async def _fetch_authorizations(self) -> List[Authorization]:
+        """Fetch all authorization rules from the authorization system."""
+        url = self.client._build_url("authorization", _AUTHORIZATIONS_LIST_PATH)
         response = await self.client._make_request(
-            "GET",
-            url,
-            error_msg="Failed to get authorizations",
-            headers={"Accept": "application/json"},
+            "GET", url, error_msg="Failed to get authorizations"
         )
-        auth_response = AuthorizationsResponse(**response.json())
+        auth_response = AuthorizationsResponse.model_validate_json(response.content)
         return auth_response.authorizations
 
     async def remove_authorization(self, auth_id: int) -> None:
         """Remove authorization rule by ID."""
-        url = self.client._build_url("authorization", f"/mgmt/intracloud/{auth_id}")
-        await self.client._make_request(
-            "DELETE",
+        url = self.client._build_url("authorization", _AUTHORIZATION_PATH % auth_id)
+        await self._delete(
             url,
             error_msg="Failed to remove authorization rule",
-            headers={"Accept": "application/json"},
+        )
+        self._invalidate("authorizations")
+
+    async def remove_authorizations(
+        self, auth_ids: Iterable[int], concurrency: int = 16
+    ) -> None:
+        """Remove several authorization rules by ID concurrently.
+
+        Args:
+            auth_ids: IDs of the rules to remove
+            concurrency: Maximum number of requests in flight
+
+        If a removal fails, the removals not yet completed are cancelled and
+        its error is raised. Rules already removed stay removed.
+        """
+        await self._gather_bounded(
+            (
+                functools.partial(self.remove_authorization, auth_id)
+                for auth_id in auth_ids
+            ),
+            concurrency,
         )
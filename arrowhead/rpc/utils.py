@@ -1,6 +1,12 @@
 """Utility functions for RPC operations."""
 
-from typing import Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 from ..core.models import (
     OrchestrationFlags,
@@ -11,6 +17,25 @@ from ..core.models import (
 )
 
 
+def encode_json(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def build_orchestration_request(
     system_name: str,
     address: str,
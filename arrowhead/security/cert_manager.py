@@ -1,14 +1,49 @@
 """Certificate management for the Arrowhead Framework."""
 
+import base64
+import datetime
+import functools
+import ipaddress
 import logging
 import os
+import re
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.serialization import pkcs12
+from cryptography.x509.oid import NameOID
+
+from .tls import keystore_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Attribute keywords accepted in distinguished names such as "CN=name".
+_DNAME_ATTRIBUTES = {
+    "CN": NameOID.COMMON_NAME,
+    "OU": NameOID.ORGANIZATIONAL_UNIT_NAME,
+    "O": NameOID.ORGANIZATION_NAME,
+    "L": NameOID.LOCALITY_NAME,
+    "ST": NameOID.STATE_OR_PROVINCE_NAME,
+    "C": NameOID.COUNTRY_NAME,
+    "DC": NameOID.DOMAIN_COMPONENT,
+}
+
+# A PEM block with its label, such as "CERTIFICATE" or "PRIVATE KEY".
+_PEM_BLOCK_RE = re.compile(
+    r"-----BEGIN ([A-Z0-9 ]+)-----\n.*?-----END \1-----\n?", re.DOTALL
+)
+
+# Validity of generated system certificates.
+_SYSTEM_CERT_DAYS = 3650
+
 
 class CertManager(ABC):
     """Abstract base class for certificate managers."""
@@ -42,15 +77,40 @@ class CertManager(ABC):
         pass
 
 
+_CertManagerT = TypeVar("_CertManagerT", bound=CertManager)
+
+
+def _cached_public_key(
+    get_public_key: Callable[[_CertManagerT, str, str], str]
+) -> Callable[[_CertManagerT, str, str], str]:
+    """Cache a get_public_key implementation per keystore file version.
+
+    Extracting the key decrypts the whole keystore, while the result only
+    changes when the keystore file does.
+    """
+    cache: Dict[Tuple[str, int, bytes], str] = {}
+
+    @functools.wraps(get_public_key)
+    def wrapper(self: _CertManagerT, keystore_path: str, password: str) -> str:
+        if not os.path.exists(keystore_path):
+            raise RuntimeError(f"Keystore file {keystore_path} not found")
+
+        cache_key = keystore_fingerprint(keystore_path, password)
+        public_key = cache.get(cache_key)
+        if public_key is None:
+            public_key = get_public_key(self, keystore_path, password)
+            # Drop keys extracted from older versions of the same file.
+            for stale_key in [k for k in cache if k[0] == cache_key[0]]:
+                del cache[stale_key]
+            cache[cache_key] = public_key
+        return public_key
+
+    return wrapper
+
+
 class OpenSSLCertManager(CertManager):
     """Certificate manager using OpenSSL."""
 
-    def _run_openssl_command(self, *args: str) -> subprocess.CompletedProcess:
-        """Run an OpenSSL command."""
-        cmd = ["openssl"] + list(args)
-        logger.debug(f"Running: {' '.join(cmd)}")
-        return subprocess.run(cmd, check=True, capture_output=True, text=True)
-
     def create_system_keystore(
         self,
         root_keystore: str,
@@ -63,280 +123,131 @@ class OpenSSLCertManager(CertManager):
         san: str,
         password: str,
     ) -> None:
-        """Create a system keystore using OpenSSL."""
+        """Create a system keystore.
+
+        The key pair, the certificate signed by the cloud CA and the PKCS#12
+        keystore are all produced in process with the cryptography package.
+        """
         logger.info(f"Creating system keystore {system_keystore} with OpenSSL")
 
-        # Generate file names
-        root_cert_file = str(Path(root_keystore).with_suffix(".crt"))
-        cloud_cert_file = str(Path(cloud_keystore).with_suffix(".crt"))
-        system_pub_file = str(Path(system_keystore).with_suffix(".pub"))
-
-        # Temporary files
-        csr_file = "csrfile.csr"
-        signed_cert_file = "signed_cert.crt"
-        system_key_file = str(Path(system_keystore).with_suffix(".key"))
-        cloud_key_file = str(Path(cloud_keystore).with_suffix(".key"))
+        system_path = Path(system_keystore)
+        root_cert_file = Path(root_keystore).with_suffix(".crt")
+        system_pub_file = system_path.with_suffix(".pub").name
 
         # Use only the basename for the system keystore
-        system_keystore = Path(system_keystore).name
-        system_pub_file = Path(system_pub_file).name
+        system_keystore = system_path.name
 
         if os.path.exists(system_keystore):
             raise RuntimeError(f"System keystore {system_keystore} already exists")
 
-        ext_file = None
-        chain_file = None
-
-        try:
-            # 1. Generate the system RSA private key
-            logger.debug("Generating system private key...")
-            self._run_openssl_command("genrsa", "-out", system_key_file, "2048")
-
-            # 2. Generate a certificate signing request (CSR) with the desired subject and SAN
-            # FIX: Use system_dname directly as the subject. It should be in "CN=name" format.
-            subj = f"/{system_dname}"
-            logger.debug(f"Generating CSR for system certificate with subject: {subj}")
-            self._run_openssl_command(
-                "req",
-                "-new",
-                "-key",
-                system_key_file,
-                "-subj",
-                subj, # Use the full subject string
-                "-addext",
-                f"subjectAltName={san}",
-                "-out",
-                csr_file,
+        password_bytes = password.encode()
+
+        # 1. Generate the system RSA private key, in the background while the
+        # cloud keystore is decrypted, as neither step depends on the other
+        logger.debug("Generating system private key...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            system_key_future = executor.submit(
+                rsa.generate_private_key,
+                public_exponent=65537,
+                key_size=2048,
+                backend=default_backend(),
             )
 
-            # 3. Extract the cloud CA's key and certificate if not already available
-            pass_arg = f"pass:{password}"
-            logger.debug("Extracting cloud key from cloud PKCS#12 file...")
-            self._run_openssl_command(
-                "pkcs12",
-                "-in",
-                cloud_keystore,
-                "-nocerts",
-                "-nodes",
-                "-passin",
-                pass_arg,
-                "-out",
-                cloud_key_file,
+            # 2. Load the cloud CA's key and certificate, and the root certificate
+            logger.debug("Loading cloud CA from cloud PKCS#12 file...")
+            cloud_key, cloud_cert, _ = pkcs12.load_key_and_certificates(
+                Path(cloud_keystore).read_bytes(), password_bytes, default_backend()
             )
-
-            if not os.path.exists(cloud_cert_file):
-                logger.debug("Extracting cloud certificate from cloud PKCS#12 file...")
-                self._run_openssl_command(
-                    "pkcs12",
-                    "-in",
-                    cloud_keystore,
-                    "-clcerts",
-                    "-nokeys",
-                    "-passin",
-                    pass_arg,
-                    "-out",
-                    cloud_cert_file,
+            if cloud_key is None or cloud_cert is None:
+                raise RuntimeError(
+                    f"Cloud keystore {cloud_keystore} has no private key or certificate"
                 )
-
-            # 4. Create a temporary extension file to supply the subjectAltName when signing
-            ext_file = "v3ext.cnf"
-            ext_content = f"[v3_ext]\nsubjectAltName = {san}\n"
-            with open(ext_file, "w") as f:
-                f.write(ext_content)
-
-            # 5. Sign the CSR with the cloud CA's key and certificate
-            logger.debug("Signing CSR with cloud CA...")
-            self._run_openssl_command(
-                "x509",
-                "-req",
-                "-in",
-                csr_file,
-                "-CA",
-                cloud_cert_file,
-                "-CAkey",
-                cloud_key_file,
-                "-CAcreateserial",  # creates a file (e.g. cloudCertFile.srl) with the serial number
-                "-out",
-                signed_cert_file,
-                "-days",
-                "3650",
-                "-extfile",
-                ext_file,
-                "-extensions",
-                "v3_ext",
+            root_cert = x509.load_pem_x509_certificate(
+                root_cert_file.read_bytes(), default_backend()
             )
 
-            # 6. Build the certificate chain file
-            # The chain file contains first the cloud certificate, then the root certificate
-            chain_file = "chain.pem"
-            chain_content = ""
-
-            with open(cloud_cert_file, "r") as f:
-                chain_content += f.read() + "\n"
-
-            with open(root_cert_file, "r") as f:
-                chain_content += f.read() + "\n"
-
-            with open(chain_file, "w") as f:
-                f.write(chain_content)
-
-            # 7. Create the system PKCS#12 keystore
-            # It bundles the system's private key, the signed certificate, and the CA chain
-            logger.debug("Creating system PKCS#12 keystore...")
-            self._run_openssl_command(
-                "pkcs12",
-                "-export",
-                "-inkey",
-                system_key_file,
-                "-in",
-                signed_cert_file,
-                "-certfile",
-                chain_file,
-                "-out",
-                system_keystore,
-                "-passout",
-                pass_arg,
-            )
-
-            # 8. Extract the system public key from the signed certificate
-            logger.debug("Extracting system public key...")
-            result = self._run_openssl_command(
-                "x509", "-in", signed_cert_file, "-pubkey", "-noout"
+            system_key = system_key_future.result()
+
+        # 3. Issue the system certificate, signed by the cloud CA
+        logger.debug(f"Signing system certificate for subject: {system_dname}")
+        now = datetime.datetime.now(datetime.timezone.utc)
+        system_cert = (
+            x509.CertificateBuilder()
+            .subject_name(_parse_dname(system_dname))
+            .issuer_name(cloud_cert.subject)
+            .public_key(system_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + datetime.timedelta(days=_SYSTEM_CERT_DAYS))
+            .add_extension(
+                x509.SubjectAlternativeName(_parse_san(san)), critical=False
             )
-
-            with open(system_pub_file, "w") as f:
-                f.write(result.stdout)
-
-        finally:
-            # 9. Clean up temporary files
-            temp_files = [
-                csr_file,
-                signed_cert_file,
-                ext_file,
-                chain_file,
-                f"{cloud_cert_file}.srl",
-                cloud_key_file,
-                system_key_file,
-            ]
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-
-        # In case the system public key file is still missing, extract it from the system keystore
-        if not os.path.exists(system_pub_file):
-            logger.debug("Extracting public key from system keystore...")
-            temp_cert = "temp_cert.crt"
-            try:
-                self._run_openssl_command(
-                    "pkcs12",
-                    "-in",
-                    system_keystore,
-                    "-nokeys",
-                    "-clcerts",
-                    "-passin",
-                    f"pass:{password}",
-                    "-out",
-                    temp_cert,
-                )
-                result = self._run_openssl_command(
-                    "x509", "-in", temp_cert, "-pubkey", "-noout"
-                )
-                with open(system_pub_file, "w") as f:
-                    f.write(result.stdout)
-            finally:
-                if os.path.exists(temp_cert):
-                    os.remove(temp_cert)
-
-    def get_public_key(self, keystore_path: str, password: str) -> str:
-        """Get public key from PKCS#12 keystore using OpenSSL."""
-        if not os.path.exists(keystore_path):
-            raise RuntimeError(f"Keystore file {keystore_path} not found")
-
-        try:
-            # Extract certificate from PKCS#12
-            cert_result = self._run_openssl_command(
-                "pkcs12",
-                "-in",
-                keystore_path,
-                "-clcerts",
-                "-nokeys",
-                "-passin",
-                f"pass:{password}",
+            .add_extension(
+                x509.SubjectKeyIdentifier.from_public_key(system_key.public_key()),
+                critical=False,
             )
-
-            # Extract public key from certificate
-            pub_key_result = subprocess.run(
-                ["openssl", "x509", "-pubkey", "-noout"],
-                input=cert_result.stdout,
-                text=True,
-                check=True,
-                capture_output=True,
+            .add_extension(
+                x509.AuthorityKeyIdentifier.from_issuer_public_key(
+                    cloud_cert.public_key()  # type: ignore[arg-type]
+                ),
+                critical=False,
             )
+            .sign(cloud_key, hashes.SHA256(), default_backend())  # type: ignore[arg-type]
+        )
+
+        # 4. Write the system public key
+        logger.debug("Writing system public key...")
+        _atomic_write(
+            system_pub_file,
+            system_cert.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+        )
+
+        # 5. Create the system PKCS#12 keystore
+        # It bundles the system's private key, the signed certificate, and the
+        # CA chain: first the cloud certificate, then the root certificate.
+        # It is written last, so an existing keystore implies a complete run,
+        # and it is published exclusively, so an existing one is never replaced.
+        logger.debug("Creating system PKCS#12 keystore...")
+        keystore_data = pkcs12.serialize_key_and_certificates(
+            name=system_alias.encode(),
+            key=system_key,
+            cert=system_cert,
+            cas=[cloud_cert, root_cert],
+            encryption_algorithm=serialization.BestAvailableEncryption(password_bytes),
+        )
+        try:
+            _atomic_write(system_keystore, keystore_data, exclusive=True)
+        except FileExistsError:
+            raise RuntimeError(
+                f"System keystore {system_keystore} already exists"
+            ) from None
 
-            # Clean output: Remove headers and newlines for authentication info format
-            public_key = pub_key_result.stdout.strip()
-            public_key = public_key.replace("-----BEGIN PUBLIC KEY-----", "")
-            public_key = public_key.replace("-----END PUBLIC KEY-----", "")
-            public_key = public_key.replace("\n", "")
-
-            return public_key
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to extract public key: {e}")
+    @_cached_public_key
+    def get_public_key(self, keystore_path: str, password: str) -> str:
+        """Get public key from PKCS#12 keystore."""
+        return _keystore_public_key(keystore_path, password)
 
     def convert_p12_to_pem(
         self, p12_file: str, password: str, output_cert: str, output_key: str
     ) -> None:
         """Convert PKCS#12 file to PEM format using OpenSSL."""
-        try:
-            # Extract certificate
-            cert_cmd = [
-                "openssl",
-                "pkcs12",
-                "-in",
-                p12_file,
-                "-out",
-                output_cert,
-                "-clcerts",
-                "-nokeys",
-                "-passin",
-                f"pass:{password}",
-            ]
-            subprocess.run(cert_cmd, check=True)
-
-            # Extract private key
-            key_cmd = [
-                "openssl",
-                "pkcs12",
-                "-in",
-                p12_file,
-                "-out",
-                output_key,
-                "-nocerts",
-                "-nodes",
-                "-passin",
-                f"pass:{password}",
-            ]
-            subprocess.run(key_cmd, check=True)
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to convert P12 to PEM: {e}")
+        _openssl_p12_to_pem(p12_file, password, output_cert, output_key)
 
 
 class KeytoolCertManager(CertManager):
     """Certificate manager using Java keytool."""
 
-    def _run_keytool_command(self, *args: str) -> subprocess.CompletedProcess:
-        """Run a keytool command."""
-        cmd = ["keytool"] + list(args)
-        logger.debug(f"Running: {' '.join(cmd)}")
-        return subprocess.run(cmd, check=True, capture_output=True, text=True)
+    def _run_keytool_command(
+        self, *args: str, capture: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Run a keytool command.
 
-    def _run_openssl_command(self, *args: str) -> subprocess.CompletedProcess:
-        """Run an OpenSSL command (keytool sometimes needs OpenSSL for some operations)."""
-        cmd = ["openssl"] + list(args)
-        logger.debug(f"Running: {' '.join(cmd)}")
-        return subprocess.run(cmd, check=True, capture_output=True, text=True)
+        Standard output is only collected when ``capture`` is set.
+        """
+        return _run_command(["keytool", *args], capture)
 
     def create_system_keystore(
         self,
@@ -354,17 +265,17 @@ class KeytoolCertManager(CertManager):
         logger.info(f"Creating system keystore {system_keystore} with keytool")
 
         # Generate file names
+        system_path = Path(system_keystore)
         root_cert_file = str(Path(root_keystore).with_suffix(".crt"))
         cloud_cert_file = str(Path(cloud_keystore).with_suffix(".crt"))
-        system_pub_file = str(Path(system_keystore).with_suffix(".pub"))
 
         # Temporary files
         csr_file = "csrfile.csr"
         signed_cert_file = "signed_cert.crt"
 
         # Use only the basename for files
-        system_keystore = Path(system_keystore).name
-        system_pub_file = Path(system_pub_file).name
+        system_keystore = system_path.name
+        system_pub_file = system_path.with_suffix(".pub").name
 
         if os.path.exists(system_keystore):
             raise RuntimeError(f"System keystore {system_keystore} already exists")
@@ -374,7 +285,6 @@ class KeytoolCertManager(CertManager):
             logger.debug("Creating system keystore...")
             self._run_keytool_command(
                 "-genkeypair",
-                "-v",
                 "-keystore",
                 system_keystore,
                 "-storepass",
@@ -400,7 +310,6 @@ class KeytoolCertManager(CertManager):
             logger.debug("Importing root certificate...")
             self._run_keytool_command(
                 "-importcert",
-                "-v",
                 "-keystore",
                 system_keystore,
                 "-storepass",
@@ -417,7 +326,6 @@ class KeytoolCertManager(CertManager):
             logger.debug("Importing cloud certificate...")
             self._run_keytool_command(
                 "-importcert",
-                "-v",
                 "-keystore",
                 system_keystore,
                 "-storepass",
@@ -434,7 +342,6 @@ class KeytoolCertManager(CertManager):
             logger.debug("Generating CSR...")
             self._run_keytool_command(
                 "-certreq",
-                "-v",
                 "-keystore",
                 system_keystore,
                 "-storepass",
@@ -452,7 +359,6 @@ class KeytoolCertManager(CertManager):
             logger.debug("Signing CSR...")
             self._run_keytool_command(
                 "-gencert",
-                "-v",
                 "-keystore",
                 cloud_keystore,
                 "-storepass",
@@ -524,103 +430,189 @@ class KeytoolCertManager(CertManager):
                 system_alias,
                 "-rfc",
                 "-noprompt",
+                capture=True,
             )
-
-            # Convert to PEM format using OpenSSL
-            pub_key_result = subprocess.run(
-                ["openssl", "x509", "-inform", "pem", "-pubkey", "-noout"],
-                input=cert_result.stdout,
-                text=True,
-                check=True,
-                capture_output=True,
-            )
-
-            # Write public key to file
-            with open(system_pub_file, "w") as f:
-                f.write(pub_key_result.stdout)
-
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to extract public key: {e}")
 
+        # Read the public key from the listed certificate in process, rather
+        # than piping it through another openssl process
+        cert_match = _PEM_BLOCK_RE.search(cert_result.stdout)
+        if cert_match is None or cert_match.group(1) != "CERTIFICATE":
+            raise RuntimeError(f"No certificate found for alias {system_alias}")
+        cert = x509.load_pem_x509_certificate(
+            cert_match.group(0).encode("ascii"), default_backend()
+        )
+
+        # Write public key to file
+        _atomic_write(
+            system_pub_file,
+            cert.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+        )
+
+    @_cached_public_key
     def get_public_key(self, keystore_path: str, password: str) -> str:
-        """Get public key from keystore using keytool and OpenSSL."""
-        if not os.path.exists(keystore_path):
-            raise RuntimeError(f"Keystore file {keystore_path} not found")
-
-        try:
-            # Extract public key from certificate using OpenSSL (similar to Go implementation)
-            cert_result = self._run_openssl_command(
-                "pkcs12",
-                "-in",
-                keystore_path,
-                "-clcerts",
-                "-nokeys",
-                "-passin",
-                f"pass:{password}",
-            )
-
-            # Extract public key from certificate
-            pub_key_result = subprocess.run(
-                ["openssl", "x509", "-pubkey", "-noout"],
-                input=cert_result.stdout,
-                text=True,
-                check=True,
-                capture_output=True,
-            )
-
-            # Clean output: Remove headers and newlines for authentication info format
-            public_key = pub_key_result.stdout.strip()
-            public_key = public_key.replace("-----BEGIN PUBLIC KEY-----", "")
-            public_key = public_key.replace("-----END PUBLIC KEY-----", "")
-            public_key = public_key.replace("\n", "")
-
-            return public_key
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to extract public key: {e}")
+        """Get public key from PKCS#12 keystore."""
+        return _keystore_public_key(keystore_path, password)
 
     def convert_p12_to_pem(
         self, p12_file: str, password: str, output_cert: str, output_key: str
     ) -> None:
         """Convert PKCS#12 file to PEM format using OpenSSL (keytool fallback)."""
-        try:
-            # Extract certificate using OpenSSL
-            self._run_openssl_command(
-                "pkcs12",
-                "-in",
-                p12_file,
-                "-clcerts",
-                "-nokeys",
-                "-passin",
-                f"pass:{password}",
-                "-out",
-                output_cert,
-            )
-
-            # Extract private key using OpenSSL
-            self._run_openssl_command(
-                "pkcs12",
-                "-in",
-                p12_file,
-                "-nocerts",
-                "-nodes",
-                "-passin",
-                f"pass:{password}",
-                "-out",
-                output_key,
-            )
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to convert P12 to PEM: {e}")
+        _openssl_p12_to_pem(p12_file, password, output_cert, output_key)
+
+
+def _atomic_write(
+    path: str, data: bytes, mode: int = 0o666, exclusive: bool = False
+) -> None:
+    """Write a file so that it is either complete or not replaced at all.
+
+    The data goes to a temporary file next to the target, which is then
+    renamed over it. With ``exclusive`` it is hard linked into place instead,
+    which raises FileExistsError rather than replacing an existing file.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if exclusive:
+            os.link(tmp_path, path)
+        else:
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _run_command(cmd: List[str], capture: bool) -> subprocess.CompletedProcess:
+    """Run an external tool, raising CalledProcessError on failure.
+
+    Output that is not captured goes to /dev/null instead of through a pipe.
+    Standard error is always kept so failures can be diagnosed.
+    """
+    # Passwords given as pass:<password> arguments are kept out of the log.
+    logged = " ".join("pass:***" if arg.startswith("pass:") else arg for arg in cmd)
+    logger.debug(f"Running: {logged}")
+    return subprocess.run(
+        cmd,
+        check=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
 
+def _keystore_public_key(keystore_path: str, password: str) -> str:
+    """Return the keystore certificate's public key as bare base64 DER.
+
+    This is the format the Service Registry expects as authentication info.
+    """
+    with open(keystore_path, "rb") as f:
+        p12_data = f.read()
+
+    try:
+        _, cert, _ = pkcs12.load_key_and_certificates(
+            p12_data, password.encode(), backend=default_backend()
+        )
+    except ValueError as e:
+        raise RuntimeError(f"Failed to extract public key: {e}")
+    if cert is None:
+        raise RuntimeError(f"No certificate found in keystore {keystore_path}")
+
+    # The PEM body without its armor and line breaks is the base64 DER, so
+    # encode that directly instead of stripping a PEM string.
+    public_der = cert.public_key().public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.b64encode(public_der).decode("ascii")
+
+
+def _openssl_p12_to_pem(
+    p12_file: str, password: str, output_cert: str, output_key: str
+) -> None:
+    """Write the certificate and private key of a PKCS#12 file as PEM files.
+
+    Both are exported by a single openssl process and split here, rather
+    than decrypting the file once per output.
+    """
+    cmd = [
+        "openssl",
+        "pkcs12",
+        "-in",
+        p12_file,
+        "-clcerts",
+        "-nodes",
+        "-passin",
+        f"pass:{password}",
+    ]
+    try:
+        result = _run_command(cmd, capture=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to convert P12 to PEM: {e}")
+
+    cert_blocks: List[str] = []
+    key_blocks: List[str] = []
+    for match in _PEM_BLOCK_RE.finditer(result.stdout):
+        if match.group(1).endswith("PRIVATE KEY"):
+            key_blocks.append(match.group(0))
+        else:
+            cert_blocks.append(match.group(0))
+    if not cert_blocks:
+        raise RuntimeError(f"No certificate found in {p12_file}")
+    if not key_blocks:
+        raise RuntimeError(f"No private key found in {p12_file}")
+
+    _atomic_write(output_cert, "".join(cert_blocks).encode())
+    _atomic_write(output_key, "".join(key_blocks).encode(), mode=0o600)
+
+
+def _parse_dname(dname: str) -> x509.Name:
+    """Parse a distinguished name such as "CN=name,O=org" (RFC 4514 order)."""
+    attributes = []
+    for part in dname.split(","):
+        key, sep, value = part.partition("=")
+        oid = _DNAME_ATTRIBUTES.get(key.strip().upper())
+        if not sep or oid is None:
+            raise ValueError(f"Unsupported distinguished name component: {part!r}")
+        attributes.append(x509.NameAttribute(oid, value.strip()))
+    # RFC 4514 strings list the most specific attribute first.
+    return x509.Name(attributes[::-1])
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_san(san: str) -> Tuple[x509.GeneralName, ...]:
+    """Parse an OpenSSL style subjectAltName value such as "DNS:a,IP:127.0.0.1"."""
+    names: List[x509.GeneralName] = []
+    for entry in san.split(","):
+        kind, _, value = entry.strip().partition(":")
+        kind = kind.upper()
+        if kind == "DNS":
+            names.append(x509.DNSName(value))
+        elif kind == "IP":
+            names.append(x509.IPAddress(ipaddress.ip_address(value)))
+        else:
+            raise ValueError(f"Unsupported subjectAltName entry: {entry!r}")
+    return tuple(names)
+
+
+@functools.lru_cache(maxsize=128)
 def generate_subject_alternative_name(name: str) -> str:
     """Generate Subject Alternative Name for certificate."""
     return f"DNS:{name},DNS:{name}-ip,DNS:localhost,IP:127.0.0.1"
 
 
+@functools.lru_cache(maxsize=None)
 def load_cert_manager() -> CertManager:
-    """Load an available certificate manager."""
+    """Load an available certificate manager.
+
+    The managers are stateless, so the choice is made once per process.
+    """
     # Check for OpenSSL
     if shutil.which("openssl"):
         logger.debug("openssl command found")
@@ -1,12 +1,115 @@
 """JWT handling for the Arrowhead Framework."""
 
-from typing import Any, Dict
+import base64
+import hmac
+import json
+import os
+import threading
+import zlib
+from typing import Any, Callable, Dict, Tuple
 
 import jwt
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from jwcrypto import jwe, jwk
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import padding as sym_padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.hmac import HMAC
+
+# Key management algorithms: JWE "alg" -> OAEP hash.
+_JWE_KEY_ALGORITHMS: Dict[str, Callable[[], hashes.HashAlgorithm]] = {
+    "RSA-OAEP": hashes.SHA1,
+    "RSA-OAEP-256": hashes.SHA256,
+}
+# AES-CBC + HMAC content encryption: JWE "enc" -> HMAC hash (RFC 7518 5.2).
+_JWE_CBC_HMAC_ALGORITHMS: Dict[str, Callable[[], hashes.HashAlgorithm]] = {
+    "A128CBC-HS256": hashes.SHA256,
+    "A192CBC-HS384": hashes.SHA384,
+    "A256CBC-HS512": hashes.SHA512,
+}
+_JWE_GCM_ALGORITHMS = frozenset({"A128GCM", "A192GCM", "A256GCM"})
+# Content encryption key length in bytes for each JWE "enc".
+_JWE_CEK_LENGTHS = {
+    "A128GCM": 16,
+    "A192GCM": 24,
+    "A256GCM": 32,
+    "A128CBC-HS256": 32,
+    "A192CBC-HS384": 48,
+    "A256CBC-HS512": 64,
+}
+# Upper bound on the inflated size of a DEF compressed payload, as in jwcrypto.
+_JWE_MAX_INFLATED_SIZE = 256 * 1024
+
+
+# Keys loaded from PEM files, keyed by (kind, path, mtime, size).
+_pem_key_cache: Dict[Tuple[str, str, int, int], Any] = {}
+_pem_key_lock = threading.Lock()
+
+
+def _load_pem_key_file(
+    filename: str, kind: str, loader: Callable[[bytes], Any]
+) -> Any:
+    """Load a key from a PEM file, reusing it until the file changes."""
+    path = os.path.realpath(filename)
+    stat = os.stat(path)
+    cache_key = (kind, path, stat.st_mtime_ns, stat.st_size)
+
+    with _pem_key_lock:
+        key = _pem_key_cache.get(cache_key)
+    if key is not None:
+        return key
+
+    with open(path, "rb") as key_file:
+        key = loader(key_file.read())
+
+    with _pem_key_lock:
+        # Drop keys loaded from older versions of the same file.
+        for stale_key in [
+            k for k in _pem_key_cache if k[0] == kind and k[1] == path
+        ]:
+            del _pem_key_cache[stale_key]
+        _pem_key_cache[cache_key] = key
+    return key
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode unpadded base64url data."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _inflate(payload: bytes) -> bytes:
+    """Inflate a DEF compressed JWE payload, refusing oversized output."""
+    # DEF is raw DEFLATE (RFC 1951), without a zlib header.
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    try:
+        inflated = decompressor.decompress(payload, _JWE_MAX_INFLATED_SIZE)
+    except zlib.error as e:
+        raise ValueError(f"Invalid JWE compressed payload: {e}")
+    if decompressor.unconsumed_tail:
+        raise ValueError(
+            f"JWE payload inflates beyond {_JWE_MAX_INFLATED_SIZE} bytes"
+        )
+    return inflated
+
+
+def _decrypt_cbc_hmac(
+    enc: str, cek: bytes, iv: bytes, ciphertext: bytes, tag: bytes, aad: bytes
+) -> bytes:
+    """Authenticate and decrypt AES-CBC + HMAC-SHA2 content (RFC 7518 5.2.2)."""
+    mac_key, enc_key = cek[: len(cek) // 2], cek[len(cek) // 2 :]
+    mac = HMAC(mac_key, _JWE_CBC_HMAC_ALGORITHMS[enc](), backend=default_backend())
+    mac.update(aad + iv + ciphertext + (len(aad) * 8).to_bytes(8, "big"))
+    if not hmac.compare_digest(mac.finalize()[: len(mac_key)], tag):
+        raise ValueError("JWE authentication tag mismatch")
+
+    decryptor = Cipher(
+        algorithms.AES(enc_key), modes.CBC(iv), backend=default_backend()
+    ).decryptor()
+    padded = decryptor.update(ciphertext) + decryptor.finalize()
+    unpadder = sym_padding.PKCS7(algorithms.AES.block_size).unpadder()
+    return unpadder.update(padded) + unpadder.finalize()
 
 
 class JWTHandler:
@@ -14,11 +117,17 @@ class JWTHandler:
 
     @staticmethod
     def load_rsa_private_key(filename: str) -> rsa.RSAPrivateKey:
-        """Load RSA private key from PEM file."""
-        with open(filename, "rb") as key_file:
-            private_key = serialization.load_pem_private_key(
-                key_file.read(), password=None, backend=default_backend()
-            )
+        """Load RSA private key from PEM file.
+
+        The parsed key is cached until the file changes.
+        """
+        private_key = _load_pem_key_file(
+            filename,
+            "private",
+            lambda data: serialization.load_pem_private_key(
+                data, password=None, backend=default_backend()
+            ),
+        )
 
         if not isinstance(private_key, rsa.RSAPrivateKey):
             raise ValueError("Not an RSA private key")
@@ -27,11 +136,17 @@ class JWTHandler:
 
     @staticmethod
     def load_rsa_public_key(filename: str) -> rsa.RSAPublicKey:
-        """Load RSA public key from PEM file."""
-        with open(filename, "rb") as key_file:
-            public_key = serialization.load_pem_public_key(
-                key_file.read(), backend=default_backend()
-            )
+        """Load RSA public key from PEM file.
+
+        The parsed key is cached until the file changes.
+        """
+        public_key = _load_pem_key_file(
+            filename,
+            "public",
+            lambda data: serialization.load_pem_public_key(
+                data, backend=default_backend()
+            ),
+        )
 
         if not isinstance(public_key, rsa.RSAPublicKey):
             raise ValueError("Not an RSA public key")
@@ -52,34 +167,66 @@ class JWTHandler:
 
     @staticmethod
     def decrypt_jwe(encrypted_jwt: str, private_key: rsa.RSAPrivateKey) -> str:
-        """Decrypt a JWE token using RSA private key."""
-        # Convert to JWK format for jwcrypto
-        private_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
+        """Decrypt a compact JWE token using RSA private key.
+
+        Supports RSA-OAEP and RSA-OAEP-256 key management, AES-GCM and
+        AES-CBC-HMAC content encryption and DEF compression. Any invalid
+        or tampered token raises ValueError.
+        """
+        parts = encrypted_jwt.split(".")
+        if len(parts) != 5:
+            raise ValueError("Invalid JWE token: expected 5 segments")
+        header_b64 = parts[0]
+        encrypted_key = _b64url_decode(parts[1])
+        iv = _b64url_decode(parts[2])
+        ciphertext = _b64url_decode(parts[3])
+        tag = _b64url_decode(parts[4])
+
+        header = json.loads(_b64url_decode(header_b64))
+        alg, enc, zip_alg = header.get("alg"), header.get("enc"), header.get("zip")
+        if alg not in _JWE_KEY_ALGORITHMS:
+            raise ValueError(f"Unsupported JWE key algorithm: {alg}")
+        if enc not in _JWE_CEK_LENGTHS:
+            raise ValueError(f"Unsupported JWE content encryption: {enc}")
+        if zip_alg not in (None, "DEF"):
+            raise ValueError(f"Unsupported JWE compression: {zip_alg}")
+        if "crit" in header:
+            # No extensions are understood, so any critical one is rejected.
+            raise ValueError(f"Unsupported critical JWE headers: {header['crit']}")
+
+        oaep_hash = _JWE_KEY_ALGORITHMS[alg]
+        cek = private_key.decrypt(
+            encrypted_key,
+            padding.OAEP(
+                mgf=padding.MGF1(algorithm=oaep_hash()),
+                algorithm=oaep_hash(),
+                label=None,
+            ),
         )
+        if len(cek) != _JWE_CEK_LENGTHS[enc]:
+            raise ValueError(f"Invalid JWE content encryption key length for {enc}")
 
-        jwk_key = jwk.JWK.from_pem(private_pem)
+        aad = header_b64.encode("ascii")
+        if enc in _JWE_GCM_ALGORITHMS:
+            try:
+                payload = AESGCM(cek).decrypt(iv, ciphertext + tag, aad)
+            except InvalidTag:
+                raise ValueError("JWE authentication tag mismatch")
+        else:
+            payload = _decrypt_cbc_hmac(enc, cek, iv, ciphertext, tag, aad)
 
-        # Decrypt the JWE
-        jwe_token = jwe.JWE()
-        jwe_token.deserialize(encrypted_jwt)
-        jwe_token.decrypt(jwk_key)
+        if zip_alg == "DEF":
+            payload = _inflate(payload)
 
-        return jwe_token.payload.decode("utf-8")
+        return payload.decode("utf-8")
 
     @staticmethod
     def verify_jwt(token_string: str, public_key: rsa.RSAPublicKey) -> Dict[str, Any]:
         """Verify JWT signature and return payload."""
-        # Convert public key to PEM format
-        public_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
+        # PyJWT takes the key object as is, so it is not serialized to PEM
+        # and parsed back on every call.
         try:
-            payload = jwt.decode(token_string, public_pem, algorithms=["RS256"])
+            payload = jwt.decode(token_string, public_key, algorithms=["RS256"])
             return payload
         except jwt.InvalidTokenError as e:
             raise ValueError(f"Invalid JWT token: {e}")
@@ -87,12 +234,5 @@ class JWTHandler:
     @staticmethod
     def create_jwt(payload: Dict[str, Any], private_key: rsa.RSAPrivateKey) -> str:
         """Create a JWT token signed with RSA private key."""
-        # Convert private key to PEM format
-        private_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-
-        token = jwt.encode(payload, private_pem, algorithm="RS256")
+        token = jwt.encode(payload, private_key, algorithm="RS256")
         return token
@@ -0,0 +1,119 @@
+"""TLS helpers for the Arrowhead Framework."""
+
+import hashlib
+import os
+import ssl
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+
+# memfd files are addressable by path through procfs, which lets the ssl
+# module read them without the material ever reaching a filesystem.
+_USE_MEMFD = hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd")
+
+# Decoded keystores keyed by (path, mtime, salted password digest), so the
+# plaintext password is never part of a cache key.
+_PASSWORD_SALT = os.urandom(16)
+_keystore_pem_cache: Dict[Tuple[str, int, bytes], Tuple[bytes, bytes]] = {}
+_keystore_pem_lock = threading.Lock()
+
+
+def keystore_fingerprint(
+    keystore_path: str, password: Optional[str]
+) -> Tuple[str, int, bytes]:
+    """Identify a keystore file version and password without keeping the password."""
+    path = os.path.realpath(keystore_path)
+    password_bytes = password.encode() if password else b""
+    return (
+        path,
+        os.stat(path).st_mtime_ns,
+        hashlib.blake2b(password_bytes, key=_PASSWORD_SALT).digest(),
+    )
+
+
+def load_keystore_pem(
+    keystore_path: str, password: Optional[str]
+) -> Tuple[bytes, bytes]:
+    """Load a PKCS#12 keystore and return its PEM certificate chain and key.
+
+    Decoding a PKCS#12 file runs its key derivation function, so the result
+    is cached per process and reused until the keystore file changes.
+    """
+    cache_key = keystore_fingerprint(keystore_path, password)
+    path = cache_key[0]
+    password_bytes = password.encode() if password else None
+
+    with _keystore_pem_lock:
+        cached = _keystore_pem_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    with open(path, "rb") as f:
+        p12_data = f.read()
+
+    private_key, cert, additional_certs = pkcs12.load_key_and_certificates(
+        p12_data, password_bytes
+    )
+
+    if private_key is None or cert is None:
+        raise ValueError("Failed to load private key or certificate from keystore")
+
+    cert_chain = [cert]
+    if additional_certs:
+        cert_chain.extend(additional_certs)
+
+    cert_pem = b"".join(
+        certificate.public_bytes(serialization.Encoding.PEM)
+        for certificate in cert_chain
+    )
+    key_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+    with _keystore_pem_lock:
+        # Drop material decoded from older versions of the same file.
+        for stale_key in [k for k in _keystore_pem_cache if k[0] == path]:
+            del _keystore_pem_cache[stale_key]
+        _keystore_pem_cache[cache_key] = (cert_pem, key_pem)
+
+    return cert_pem, key_pem
+
+
+def load_cert_chain_from_memory(
+    context: ssl.SSLContext, cert_pem: bytes, key_pem: bytes
+) -> None:
+    """Load a PEM certificate chain and private key held in memory.
+
+    ``ssl.SSLContext.load_cert_chain`` only accepts file paths. On Linux the
+    PEM data is handed over through anonymous memory files; elsewhere it is
+    written to a private temporary directory that is removed immediately
+    after loading.
+    """
+    if _USE_MEMFD:
+        with os.fdopen(os.memfd_create("cert.pem"), "wb") as cert_file, os.fdopen(
+            os.memfd_create("key.pem"), "wb"
+        ) as key_file:
+            cert_file.write(cert_pem)
+            key_file.write(key_pem)
+            cert_file.flush()
+            key_file.flush()
+            context.load_cert_chain(
+                f"/proc/self/fd/{cert_file.fileno()}",
+                f"/proc/self/fd/{key_file.fileno()}",
+            )
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cert_path = Path(temp_dir) / "cert.pem"
+        key_path = Path(temp_dir) / "key.pem"
+        cert_path.write_bytes(cert_pem)
+        key_fd = os.open(key_path, os.O_WRONLY | os.O_CREAT, 0o600)
+        with os.fdopen(key_fd, "wb") as key_file:
+            key_file.write(key_pem)
+        context.load_cert_chain(str(cert_path), str(key_path))
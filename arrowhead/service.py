@@ -1,11 +1,17 @@
 """Service interface and parameter classes for Arrowhead Framework."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
+# Slotted dataclasses need Python 3.10; older versions keep a __dict__.
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Params:
     """Parameters for service requests."""
 
@@ -0,0 +1,217 @@
+"""Tests for JWE decryption against the RFC 7516 appendix examples."""
+
+import base64
+import json
+import zlib
+from typing import Dict
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from arrowhead.security.jwt_handler import (
+    _JWE_MAX_INFLATED_SIZE,
+    JWTHandler,
+    _decrypt_cbc_hmac,
+)
+
+# RFC 7516 Appendix A.1: RSA-OAEP and A256GCM.
+A1_KEY = {
+    "n": "oahUIoWw0K0usKNuOR6H4wkf4oBUXHTxRvgb48E-BVvxkeDNjbC4he8rUW"
+    "cJoZmds2h7M70imEVhRU5djINXtqllXI4DFqcI1DgjT9LewND8MW2Krf3S"
+    "psk_ZkoFnilakGygTwpZ3uesH-PFABNIUYpOiN15dsQRkgr0vEhxN92i2a"
+    "sbOenSZeyaxziK72UwxrrKoExv6kc5twXTq4h-QChLOln0_mtUZwfsRaMS"
+    "tPs6mS6XrgxnxbWhojf663tuEQueGC-FCMfra36C9knDFGzKsNa7LZK2dj"
+    "YgyD3JR_MB_4NUJW_TqOQtwHYbxevoJArm-L5StowjzGy-_bq6Gw",
+    "e": "AQAB",
+    "d": "kLdtIj6GbDks_ApCSTYQtelcNttlKiOyPzMrXHeI-yk1F7-kpDxY4-WY5N"
+    "WV5KntaEeXS1j82E375xxhWMHXyvjYecPT9fpwR_M9gV8n9Hrh2anTpTD9"
+    "3Dt62ypW3yDsJzBnTnrYu1iwWRgBKrEYY46qAZIrA2xAwnm2X7uGR1hghk"
+    "qDp0Vqj3kbSCz1XyfCs6_LehBwtxHIyh8Ripy40p24moOAbgxVw3rxT_vl"
+    "t3UVe4WO3JkJOzlpUf-KTVI2Ptgm-dARxTEtE-id-4OJr0h-K-VFs3VSnd"
+    "VTIznSxfyrj8ILL6MG_Uv8YAu7VILSB3lOW085-4qE3DzgrTjgyQ",
+    "p": "1r52Xk46c-LsfB5P442p7atdPUrxQSy4mti_tZI3Mgf2EuFVbUoDBvaRQ-"
+    "SWxkbkmoEzL7JXroSBjSrK3YIQgYdMgyAEPTPjXv_hI2_1eTSPVZfzL0lf"
+    "fNn03IXqWF5MDFuoUYE0hzb2vhrlN_rKrbfDIwUbTrjjgieRbwC6Cl0",
+    "q": "wLb35x7hmQWZsWJmB_vle87ihgZ19S8lBEROLIsZG4ayZVe9Hi9gDVCOBm"
+    "UDdaDYVTSNx_8Fyw1YYa9XGrGnDew00J28cRUoeBB_jKI1oma0Orv1T9aX"
+    "IWxKwd4gvxFImOWr3QRL9KEBRzk2RatUBnmDZJTIAfwTs0g68UZHvtc",
+    "dp": "ZK-YwE7diUh0qR1tR7w8WHtolDx3MZ_OTowiFvgfeQ3SiresXjm9gZ5KL"
+    "hMXvo-uz-KUJWDxS5pFQ_M0evdo1dKiRTjVw_x4NyqyXPM5nULPkcpU827"
+    "rnpZzAJKpdhWAgqrXGKAECQH0Xt4taznjnd_zVpAmZZq60WPMBMfKcuE",
+    "dq": "Dq0gfgJ1DdFGXiLvQEZnuKEN0UUmsJBxkjydc3j4ZYdBiMRAy86x0vHCj"
+    "ywcMlYYg4yoC4YZa9hNVcsjqA3FeiL19rk8g6Qn29Tt0cj8qqyFpz9vNDB"
+    "UfCAiJVeESOjJDZPYHdHY8v1b-o-Z2X5tvLx-TCekf7oxyeKDUqKWjis",
+    "qi": "VIMpMYbPf47dT1w_zDUXfPimsSegnMOA1zTaX7aGk_8urY6R8-ZW1FxU7"
+    "AlWAyLWybqq6t16VFd7hQd0y6flUK4SlOydB61gwanOsXGOAOv82cHq0E3"
+    "eL4HrtZkUuKvnPrMnsUUFlfUdybVzxyjz9JF_XyaY14ardLSjf4L_FNY",
+}
+A1_TOKEN = (
+    "eyJhbGciOiJSU0EtT0FFUCIsImVuYyI6IkEyNTZHQ00ifQ."
+    "OKOawDo13gRp2ojaHV7LFpZcgV7T6DVZKTyKOMTYUmKoTCVJRgckCL9kiMT03JGe"
+    "ipsEdY3mx_etLbbWSrFr05kLzcSr4qKAq7YN7e9jwQRb23nfa6c9d-StnImGyFDb"
+    "Sv04uVuxIp5Zms1gNxKKK2Da14B8S4rzVRltdYwam_lDp5XnZAYpQdb76FdIKLaV"
+    "mqgfwX7XWRxv2322i-vDxRfqNzo_tETKzpVLzfiwQyeyPGLBIO56YJ7eObdv0je8"
+    "1860ppamavo35UgoRdbYaBcoh9QcfylQr66oc6vFWXRcZ_ZT2LawVCWTIy3brGPi"
+    "6UklfCpIMfIjf7iGdXKHzg."
+    "48V1_ALb6US04U3b."
+    "5eym8TW_c8SuK0ltJ3rpYIzOeDQz7TALvtu6UG9oMo4vpzs9tX_EFShS8iB7j6ji"
+    "SdiwkIr3ajwQzaBtQD_A."
+    "XFBoMYUZodetZdvTiFvSkQ"
+)
+A1_PLAINTEXT = "The true sign of intelligence is not knowledge but imagination."
+
+# RFC 7516 Appendix A.2: A128CBC-HS256 content encryption. The example wraps
+# the key with RSA1_5, which is not supported, so the content decryption is
+# checked with the content encryption key given in A.2.2.
+A2_HEADER_B64 = "eyJhbGciOiJSU0ExXzUiLCJlbmMiOiJBMTI4Q0JDLUhTMjU2In0"
+A2_CEK = bytes(
+    [4, 211, 31, 197, 84, 157, 252, 254, 11, 100, 157, 250, 63, 170, 106, 206,
+     107, 124, 212, 45, 111, 107, 9, 219, 200, 177, 0, 240, 143, 156, 44, 207]
+)  # fmt: skip
+A2_IV = "AxY8DCtDaGlsbGljb3RoZQ"
+A2_CIPHERTEXT = "KDlTtXchhZTGufMYmOYGS4HffxPSUrfmqCHXaI9wOGY"
+A2_TAG = "9hH0vgRfYgPnAHOd8stkvw"
+A2_PLAINTEXT = b"Live long and prosper."
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _b64url_int(data: str) -> int:
+    return int.from_bytes(_b64url_decode(data), "big")
+
+
+def _rsa_key(jwk: Dict[str, str]) -> rsa.RSAPrivateKey:
+    n, e, d, p, q, dp, dq, qi = (
+        _b64url_int(jwk[name]) for name in ("n", "e", "d", "p", "q", "dp", "dq", "qi")
+    )
+    return rsa.RSAPrivateNumbers(
+        p, q, d, dp, dq, qi, rsa.RSAPublicNumbers(e, n)
+    ).private_key()
+
+
+def _encrypt_gcm(
+    key: rsa.RSAPrivateKey, header: Dict[str, object], cek: bytes, plaintext: bytes
+) -> str:
+    header_b64 = _b64url(json.dumps(header).encode())
+    encrypted_key = key.public_key().encrypt(
+        cek,
+        padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA1()),
+            algorithm=hashes.SHA1(),
+            label=None,
+        ),
+    )
+    iv = bytes(12)
+    sealed = AESGCM(cek).encrypt(iv, plaintext, header_b64.encode("ascii"))
+    segments = [encrypted_key, iv, sealed[:-16], sealed[-16:]]
+    return ".".join([header_b64, *(_b64url(segment) for segment in segments)])
+
+
+def test_decrypt_rfc7516_a1() -> None:
+    assert JWTHandler.decrypt_jwe(A1_TOKEN, _rsa_key(A1_KEY)) == A1_PLAINTEXT
+
+
+def test_decrypt_cbc_hmac_rfc7516_a2() -> None:
+    plaintext = _decrypt_cbc_hmac(
+        "A128CBC-HS256",
+        A2_CEK,
+        _b64url_decode(A2_IV),
+        _b64url_decode(A2_CIPHERTEXT),
+        _b64url_decode(A2_TAG),
+        A2_HEADER_B64.encode("ascii"),
+    )
+    assert plaintext == A2_PLAINTEXT
+
+
+def test_decrypt_cbc_hmac_rejects_modified_tag() -> None:
+    tag = bytearray(_b64url_decode(A2_TAG))
+    tag[0] ^= 1
+    with pytest.raises(ValueError):
+        _decrypt_cbc_hmac(
+            "A128CBC-HS256",
+            A2_CEK,
+            _b64url_decode(A2_IV),
+            _b64url_decode(A2_CIPHERTEXT),
+            bytes(tag),
+            A2_HEADER_B64.encode("ascii"),
+        )
+
+
+def test_decrypt_rejects_modified_gcm_tag() -> None:
+    header, encrypted_key, iv, ciphertext, tag = A1_TOKEN.split(".")
+    modified = bytearray(_b64url_decode(tag))
+    modified[0] ^= 1
+    token = ".".join([header, encrypted_key, iv, ciphertext, _b64url(bytes(modified))])
+    with pytest.raises(ValueError, match="tag mismatch"):
+        JWTHandler.decrypt_jwe(token, _rsa_key(A1_KEY))
+
+
+def test_decrypt_rejects_unsupported_key_algorithm() -> None:
+    token = ".".join([A2_HEADER_B64, "AA", A2_IV, A2_CIPHERTEXT, A2_TAG])
+    with pytest.raises(ValueError, match="RSA1_5"):
+        JWTHandler.decrypt_jwe(token, _rsa_key(A1_KEY))
+
+
+def test_decrypt_inflates_def_payload() -> None:
+    key = _rsa_key(A1_KEY)
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    compressed = compressor.compress(A1_PLAINTEXT.encode()) + compressor.flush()
+    token = _encrypt_gcm(
+        key, {"alg": "RSA-OAEP", "enc": "A256GCM", "zip": "DEF"}, bytes(32), compressed
+    )
+    assert JWTHandler.decrypt_jwe(token, key) == A1_PLAINTEXT
+
+
+def test_decrypt_rejects_oversized_def_payload() -> None:
+    key = _rsa_key(A1_KEY)
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    compressed = (
+        compressor.compress(bytes(_JWE_MAX_INFLATED_SIZE + 1)) + compressor.flush()
+    )
+    token = _encrypt_gcm(
+        key, {"alg": "RSA-OAEP", "enc": "A256GCM", "zip": "DEF"}, bytes(32), compressed
+    )
+    with pytest.raises(ValueError, match="inflates beyond"):
+        JWTHandler.decrypt_jwe(token, key)
+
+
+def test_decrypt_rejects_invalid_def_payload() -> None:
+    key = _rsa_key(A1_KEY)
+    token = _encrypt_gcm(
+        key, {"alg": "RSA-OAEP", "enc": "A256GCM", "zip": "DEF"}, bytes(32), b"\xff"
+    )
+    with pytest.raises(ValueError, match="compressed payload"):
+        JWTHandler.decrypt_jwe(token, key)
+
+
+@pytest.mark.parametrize(
+    "extra_header",
+    [{"zip": "GZIP"}, {"crit": ["exp"], "exp": 0}],
+)
+def test_decrypt_rejects_unsupported_headers(extra_header: Dict[str, object]) -> None:
+    key = _rsa_key(A1_KEY)
+    token = _encrypt_gcm(
+        key, {"alg": "RSA-OAEP", "enc": "A256GCM", **extra_header}, bytes(32), b"x"
+    )
+    with pytest.raises(ValueError, match="compression|critical"):
+        JWTHandler.decrypt_jwe(token, key)
+
+
+def test_decrypt_rejects_key_length_mismatch() -> None:
+    key = _rsa_key(A1_KEY)
+    token = _encrypt_gcm(key, {"alg": "RSA-OAEP", "enc": "A128GCM"}, bytes(32), b"x")
+    with pytest.raises(ValueError, match="key length"):
+        JWTHandler.decrypt_jwe(token, key)
+
+
+def test_decrypt_rejects_malformed_token() -> None:
+    with pytest.raises(ValueError, match="5 segments"):
+        JWTHandler.decrypt_jwe("a.b.c", _rsa_key(A1_KEY))